@@ -1,7 +1,9 @@
 import hashlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Iterator, Type, Tuple
+from typing import Dict, Any, Iterator, Optional, Type, Tuple
 
 from dataclasses import dataclass, field
 from dataclasses_json import dataclass_json, config
@@ -19,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 AppId = str
 
+APP_MANIFEST_FILE_NAME = '.manifest.json'
+_APP_MANIFEST_TMP_FILE_NAME = APP_MANIFEST_FILE_NAME + '.tmp'
+
 
 @dataclass_json
 @dataclass
@@ -50,10 +55,18 @@ class AppDefinition:
             digest_size=16
         ).hexdigest()
 
+    def event_payload(self) -> Dict[str, Any]:
+        """ JSON-compatible dict published in RPC events. """
+        return json.loads(self.to_json())
+
     @classmethod
     def from_json(cls, json_str: str) -> 'AppDefinition':
         raise NotImplementedError  # A stub to silence the linters
 
+    @classmethod
+    def from_dict(cls, kvs: Dict[str, Any]) -> 'AppDefinition':
+        raise NotImplementedError  # A stub to silence the linters
+
     def to_json(self) -> str:
         raise NotImplementedError  # A stub to silence the linters
 
@@ -82,14 +95,89 @@ def load_app_from_json_file(json_file: Path) -> AppDefinition:
         raise ValueError(msg)
 
 
-def load_apps_from_dir(app_dir: Path) -> Iterator[Tuple[Path, AppDefinition]]:
+class AppManifest:
+    """ On-disk cache of app definitions parsed from an app directory. Entries
+        are keyed by file name and are valid as long as the file's
+        modification time doesn't change. """
+
+    def __init__(self, app_dir: Path) -> None:
+        self._path = app_dir / APP_MANIFEST_FILE_NAME
+        self._cached: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            cached = json.loads(self._path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict):
+            self._cached = cached
+        else:
+            logger.warning(
+                "Invalid app manifest, ignoring. path=%s", self._path)
+
+    def get(self, json_file: Path, mtime: int) -> Optional[AppDefinition]:
+        """ Return cached definition for the given file or None if there is
+            no valid entry. """
+        entry = self._cached.get(json_file.name)
+        if not isinstance(entry, dict) or entry.get('mtime') != mtime:
+            return None
+        try:
+            app_def = AppDefinition.from_dict(entry['definition'])
+        except (AttributeError, ValueError, KeyError, TypeError):
+            return None
+        self._entries[json_file.name] = entry
+        return app_def
+
+    def put(self, json_file: Path, mtime: int, app_def: AppDefinition) -> None:
+        self._entries[json_file.name] = {
+            'mtime': mtime,
+            'definition': json.loads(app_def.to_json()),
+        }
+
+    def save(self) -> None:
+        """ Write entries collected since loading the manifest. Entries for
+            files which were not seen are dropped. """
+        if self._entries == self._cached:
+            return
+        tmp_path = self._path.with_name(_APP_MANIFEST_TMP_FILE_NAME)
+        try:
+            tmp_path.write_text(json.dumps(self._entries), encoding='utf-8')
+            os.replace(str(tmp_path), str(self._path))
+        except OSError:
+            logger.exception("Error writing app manifest. path=%s", self._path)
+            return
+        self._cached = dict(self._entries)
+
+
+def load_apps_from_dir(
+        app_dir: Path,
+        manifest: Optional[AppManifest] = None,
+) -> Iterator[Tuple[Path, AppDefinition]]:
     """ Read every file in the given directory and attempt to parse it. Ignore
-        files which don't contain valid app definitions. """
+        files which don't contain valid app definitions. If a manifest is
+        given, skip parsing files with a valid manifest entry. """
     for json_file in app_dir.iterdir():
+        if json_file.name in (
+                APP_MANIFEST_FILE_NAME, _APP_MANIFEST_TMP_FILE_NAME):
+            continue
+        try:
+            mtime = json_file.stat().st_mtime_ns
+        except OSError:
+            continue
+
+        if manifest is not None:
+            app_def = manifest.get(json_file, mtime)
+            if app_def is not None:
+                yield (json_file, app_def)
+                continue
         try:
-            yield (json_file, load_app_from_json_file(json_file))
+            app_def = load_app_from_json_file(json_file)
         except ValueError:
             continue
+        if manifest is not None:
+            manifest.put(json_file, mtime, app_def)
+        yield (json_file, app_def)
 
 
 def app_json_file_name(app_def: AppDefinition) -> str:
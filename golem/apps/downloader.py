@@ -1,4 +1,5 @@
 import abc
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import logging
 from pathlib import Path
@@ -14,6 +15,8 @@ from golem.core.variables import APP_DEFINITIONS_CDN_URL
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_DOWNLOADS = 16
+
 
 class FromXml(abc.ABC):
     """ Base class for objects which can be parsed from XML. This is used to
@@ -98,7 +101,8 @@ def download_definition(
 
 def download_definitions(app_dir: Path) -> typing.List[AppDefinition]:
     """ Download app definitions from Golem Factory CDN. Only downloads
-        definitions which are not already present locally.
+        definitions which are not already present locally. Definitions are
+        downloaded concurrently, failed downloads are logged and skipped.
         :param: app_dir: path to directory containing local app definitions.
         :return: list of newly downloaded app definitions. """
     new_definitions = []
@@ -109,10 +113,25 @@ def download_definitions(app_dir: Path) -> typing.List[AppDefinition]:
         bucket_listing
     )
 
-    for metadata in bucket_listing.contents:
-        definition_path = app_dir / metadata.key
-        if not (definition_path).exists():
-            new_definitions.append(
-                download_definition(metadata.key, definition_path))
+    missing_keys = [
+        metadata.key for metadata in bucket_listing.contents
+        if not (app_dir / metadata.key).exists()
+    ]
+    if not missing_keys:
+        return new_definitions
+
+    max_workers = min(len(missing_keys), MAX_CONCURRENT_DOWNLOADS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            key: executor.submit(download_definition, key, app_dir / key)
+            for key in missing_keys
+        }
+
+    for key, future in futures.items():
+        try:
+            new_definitions.append(future.result())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(
+                'Failed to download app definition. key=%s, error=%s', key, e)
 
     return new_definitions
@@ -1,23 +1,51 @@
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from dataclasses import asdict
 from requests.exceptions import RequestException
 
 from golem.apps import (
     AppId,
     AppDefinition,
+    AppManifest,
     app_json_file_name,
     load_apps_from_dir
 )
 from golem.apps.downloader import download_definitions
-from golem.model import AppConfiguration
+from golem.core.common import default_now
+from golem.model import AppConfiguration, db
 from golem.report import EventPublisher
 from golem.rpc.mapping.rpceventnames import App
 
 logger = logging.getLogger(__name__)
 
+# SQLite limits the number of host parameters in a single statement to 999,
+# every AppConfiguration row takes 4 of them.
+BULK_INSERT_BATCH_SIZE = 200
+
+# Hot path lookups bypass the query builder
+_GET_ENABLED_SQL = (
+    f'SELECT enabled FROM {AppConfiguration._meta.db_table} '  # noqa pylint: disable=protected-access
+    'WHERE app_id = ?'
+)
+
+
+class _AppEntry:
+    """ Registered application with its definition file and enabled flag. """
+    __slots__ = ('app_id', 'definition', 'path', 'enabled')
+
+    def __init__(
+            self,
+            app_id: AppId,
+            definition: AppDefinition,
+            path: Optional[Path] = None,
+            enabled: bool = False,
+    ) -> None:
+        self.app_id = app_id
+        self.definition = definition
+        self.path = path
+        self.enabled = enabled
+
 
 class AppManager:
     """ Manager class for applications using Task API. """
@@ -25,69 +53,114 @@ class AppManager:
     def __init__(self, app_dir: Path, download_apps: bool = True) -> None:
         self.app_dir: Path = app_dir
         self.app_dir.mkdir(exist_ok=True)
-        self._apps: Dict[AppId, AppDefinition] = {}
-        self._state = AppStates()
-        self._app_file_names: Dict[AppId, Path] = dict()
+        self._entries: Dict[AppId, _AppEntry] = {}
+        self._state = AppStates.load()
 
         # Download default apps then load all apps from path
         if download_apps:
             self.update_apps(register_apps=False)
-        for app_def_path, app_def in load_apps_from_dir(app_dir):
-            self.register_app(app_def)
-            self._app_file_names[app_def.id] = app_def_path
+        manifest = AppManifest(app_dir)
+        self._register_apps([
+            (app_def.id, app_def, app_def_path)
+            for app_def_path, app_def in load_apps_from_dir(app_dir, manifest)
+        ])
+        manifest.save()
 
     def registered(self, app_id) -> bool:
-        return app_id in self._apps
+        return app_id in self._entries
 
-    def register_app(self, app: AppDefinition) -> None:
+    def register_app(
+            self,
+            app: AppDefinition,
+            path: Optional[Path] = None,
+    ) -> None:
         """ Register an application in the manager. """
-        app_id = app.id
-        if app_id in self._apps:
+        self._register_apps([(app.id, app, path)])
+
+    def _register_apps(
+            self,
+            apps: List[Tuple[AppId, AppDefinition, Optional[Path]]],
+    ) -> None:
+        """ Register applications and store default states of the new ones
+            in a single transaction. On failure no application is
+            registered. """
+        new_entries: List[_AppEntry] = []
+        try:
+            for app_id, app, path in apps:
+                new_entries.append(self._add_app(app_id, app, path))
+            self._state.bulk_set({
+                entry.app_id: False for entry in new_entries
+                if entry.app_id not in self._state
+            })
+        except Exception:
+            for entry in new_entries:
+                del self._entries[entry.app_id]
+            raise
+
+        for entry in new_entries:
+            entry.enabled = self._state[entry.app_id]
+            self._log_registered(entry)
+
+    def _add_app(
+            self,
+            app_id: AppId,
+            app: AppDefinition,
+            path: Optional[Path] = None,
+    ) -> _AppEntry:
+        if app_id in self._entries:
             raise ValueError(
                 f"Application already registered. "
                 f"app_name={app.name} app_id={app_id}")
-        self._apps[app_id] = app
-        if app_id not in self._state:
-            self._state[app_id] = False
+        entry = self._entries[app_id] = _AppEntry(app_id, app, path)
+        return entry
+
+    @staticmethod
+    def _log_registered(entry: _AppEntry) -> None:
+        app = entry.definition
         logger.info(
             "Application registered. app_name=%r:%r, state=%r, app_id=%r",
             app.name,
             app.version,
-            self._state[app_id],
-            app_id,
+            entry.enabled,
+            entry.app_id,
         )
 
     def enabled(self, app_id: AppId) -> bool:
         """ Check if an application with the given ID is registered in the
             manager and enabled. """
-        return app_id in self._apps and \
-            app_id in self._state and \
-            self._state[app_id]
+        entry = self._entries.get(app_id)
+        return entry is not None and entry.enabled
 
     def set_enabled(self, app_id: AppId, enabled: bool) -> None:
         """ Enable or disable an application. Raise an error if the application
             is not registered or the environment associated with the application
             is not available. """
-        if app_id not in self._apps:
+        entry = self._entries.get(app_id)
+        if entry is None:
             raise ValueError(f"Application not registered. app_id={app_id}")
         self._state[app_id] = enabled
+        entry.enabled = enabled
         logger.info(
             "Application %s. app_id=%r",
             'enabled' if enabled else 'disabled', app_id)
 
     def apps(self) -> List[Tuple[AppId, AppDefinition]]:
         """ Get all registered apps. """
-        return list(self._apps.items())
+        return [
+            (app_id, entry.definition)
+            for app_id, entry in self._entries.items()
+        ]
 
     def app(self, app_id: AppId) -> AppDefinition:
         """ Get an app with given ID (assuming it is registered). """
-        return self._apps[app_id]
+        return self._entries[app_id].definition
 
     def delete(self, app_id: AppId) -> bool:
         # Delete self._state from the database first
         del self._state[app_id]
-        del self._apps[app_id]
-        self._app_file_names[app_id].unlink()
+        entry = self._entries.pop(app_id)
+        if entry.path is not None:
+            entry.path.unlink()
         return True
 
     def update_apps(self, register_apps: bool = True):
@@ -101,58 +174,140 @@ class AppManager:
             logger.error('Failed to download new app definitions. %s', e)
             return
 
-        for app in new_apps:
+        app_ids = [app.id for app in new_apps]
+        for app_id, app in zip(app_ids, new_apps):
             logger.info(
                 'New application definition downloaded. '
                 'app_name=%s, app_version=%s, app_id=%r',
                 app.name,
                 app.version,
-                app.id
+                app_id
             )
-            if register_apps:
-                self.register_app(app)
-                app_file_path = self.app_dir / app_json_file_name(app)
-                self._app_file_names[app.id] = app_file_path
+        if register_apps:
+            self._register_apps([
+                (app_id, app, self.app_dir / app_json_file_name(app))
+                for app_id, app in zip(app_ids, new_apps)
+            ])
 
-            EventPublisher.publish(App.evt_new_definiton, asdict(app))
+        for app in new_apps:
+            EventPublisher.publish(App.evt_new_definiton, app.event_payload())
 
 
 class AppStates:
+    """ Persistent enabled/disabled state of applications. Lookups are cached
+        in-process, the cache is updated on every write. When created with
+        a preloaded cache, the cache is complete and lookups never query
+        the database. """
+
+    def __init__(self, cache: Optional[Dict[str, bool]] = None) -> None:
+        self._cache: Dict[str, bool] = dict(cache or {})
+        self._complete = cache is not None
+
+    @classmethod
+    def load(cls) -> 'AppStates':
+        """ Read states of all applications with a single query. """
+        query = AppConfiguration.select(
+            AppConfiguration.app_id,
+            AppConfiguration.enabled,
+        ).tuples()
+        return cls(cache={app_id: enabled for app_id, enabled in query})
 
     def __contains__(self, key):
         if not isinstance(key, str):
             self._raise_no_str_type(key)
+        if key in self._cache:
+            return True
+        if self._complete:
+            return False
 
-        return AppConfiguration.select(AppConfiguration.app_id) \
-            .where(AppConfiguration.app_id == key) \
-            .exists()
+        enabled = self._fetch(key)
+        if enabled is None:
+            return False
+        self._cache[key] = enabled
+        return True
 
     def __getitem__(self, key):
         if not isinstance(key, str):
             self._raise_no_str_type(key)
-        try:
-            return AppConfiguration \
-                .get(AppConfiguration.app_id == key) \
-                .enabled
-        except AppConfiguration.DoesNotExist:
+        if key in self._cache:
+            return self._cache[key]
+        if self._complete:
+            raise KeyError(key)
+
+        enabled = self._fetch(key)
+        if enabled is None:
             raise KeyError(key)
+        self._cache[key] = enabled
+        return enabled
 
     def __setitem__(self, key, val):
         if not isinstance(key, str):
             self._raise_no_str_type(key)
         if not isinstance(val, bool):
             raise TypeError(f"Value is of type {type(val)}; bool expected")
+        if self._cache.get(key) is val:
+            return
+
+        now = default_now()
+        AppConfiguration.insert(
+            app_id=key,
+            enabled=val,
+            created_date=now,
+            modified_date=now,
+        ).upsert().execute()
+        self._cache[key] = val
+
+    def bulk_set(self, items: Dict[str, bool]) -> None:
+        """ Set states of multiple applications using batched inserts. """
+        for key, val in items.items():
+            if not isinstance(key, str):
+                self._raise_no_str_type(key)
+            if not isinstance(val, bool):
+                raise TypeError(f"Value is of type {type(val)}; bool expected")
+        items = {
+            key: val for key, val in items.items()
+            if self._cache.get(key) is not val
+        }
+        if not items:
+            return
 
-        AppConfiguration.insert(app_id=key, enabled=val).upsert().execute()
+        now = default_now()
+        rows = [
+            {
+                'app_id': key,
+                'enabled': val,
+                'created_date': now,
+                'modified_date': now,
+            }
+            for key, val in items.items()
+        ]
+        with db.atomic():
+            for i in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+                AppConfiguration.insert_many(
+                    rows[i:i + BULK_INSERT_BATCH_SIZE]).upsert().execute()
+        self._cache.update(items)
 
     def __delitem__(self, key):
-        try:
-            AppConfiguration.delete() \
-                .where(AppConfiguration.app_id == key).execute()
-        except AppConfiguration.DoesNotExist:
-            logger.warning('Can not delete app, not found. id=%e', key)
+        if not isinstance(key, str):
+            self._raise_no_str_type(key)
+
+        self._cache.pop(key, None)
+        deleted = AppConfiguration.delete() \
+            .where(AppConfiguration.app_id == key).execute()
+        if not deleted:
+            logger.warning('Can not delete app, not found. id=%r', key)
             raise KeyError(key)
 
+    @staticmethod
+    def _fetch(key) -> Optional[bool]:
+        cursor = db.execute_sql(
+            _GET_ENABLED_SQL, (key,), require_commit=False)
+        try:
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        return None if row is None else bool(row[0])
+
     @staticmethod
     def _raise_no_str_type(key):
         raise TypeError(f"Key is of type {type(key)}; str expected")
@@ -1,8 +1,6 @@
 # pylint: disable=unused-import
 from typing import Type, Union
 
-from bidict import bidict
-
 from .marketplace import (  # noqa
     RequestorMarketStrategy,
     ProviderMarketStrategy,
@@ -22,11 +20,6 @@ from .wasm_marketplace import (  # noqa
 DEFAULT_REQUESTOR_MARKET_STRATEGY = RequestorBrassMarketStrategy
 DEFAULT_PROVIDER_MARKET_STRATEGY = ProviderBrassMarketStrategy
 
-REQUESTOR_MARKET_STRATEGIES = bidict({
-    'wasm': RequestorWasmMarketStrategy,
-    'brass': RequestorBrassMarketStrategy,
-})
-
 
 # Using Union; type(Type[...]) check is failing in dataclasses-json
 def requestor_market_strategy_decode(
@@ -35,11 +28,11 @@ def requestor_market_strategy_decode(
     if not strategy:
         return DEFAULT_REQUESTOR_MARKET_STRATEGY
     elif isinstance(strategy, str):
-        return REQUESTOR_MARKET_STRATEGIES[strategy.lower()]
+        return RequestorMarketStrategy.get_by_name(strategy.lower())
     return strategy
 
 
 def requestor_market_strategy_encode(
         strategy: Type[RequestorMarketStrategy],
 ) -> str:
-    return REQUESTOR_MARKET_STRATEGIES.inverse[strategy]
+    return RequestorMarketStrategy.get_name(strategy)
@@ -36,7 +36,10 @@ class BrassMarketOffer:
     quality: Tuple[float, float, float, float] = (.0, .0, .0, .0)
 
 
-class RequestorBrassMarketStrategy(RequestorPoolingMarketStrategy):
+class RequestorBrassMarketStrategy(
+        RequestorPoolingMarketStrategy,
+        name='brass',
+):
     # pylint: disable-msg=line-too-long
     @classmethod
     def resolve_task_offers(cls, task_id: str) -> List[Offer]:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import ClassVar, Dict, List, Optional, Type
 
 from dataclasses import dataclass
 
@@ -8,17 +8,29 @@ from golem_messages.message.tasks import (
 )
 
 
+@dataclass(frozen=True)
 class ProviderPerformance:
-    def __init__(self, usage_benchmark: float):
-        """
-        Arguments:
-            usage_benchmark {float} -- Use benchmark in seconds
-        """
-        self.usage_benchmark: float = usage_benchmark
+    """
+    Arguments:
+        usage_benchmark {float} -- Use benchmark in seconds
+    """
+    __slots__ = ('usage_benchmark',)
+
+    usage_benchmark: float
+
+    # Frozen instances can't be restored with setattr by copy and pickle
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
 
 @dataclass
 class Offer:
+    __slots__ = ('provider_id', 'provider_performance', 'max_price', 'price')
+
     provider_id: str
     provider_performance: ProviderPerformance
     max_price: float
@@ -27,12 +39,45 @@ class Offer:
 
 @dataclass
 class ProviderPricing:
+    __slots__ = ('price_per_wallclock_h', 'price_per_cpu_h')
+
     price_per_wallclock_h: int
     price_per_cpu_h: int
 
 
 class RequestorMarketStrategy(ABC):
 
+    # Strategies declared with a name, e.g.
+    # `class Strategy(RequestorMarketStrategy, name='foo')`
+    _registry: ClassVar[Dict[str, Type['RequestorMarketStrategy']]] = dict()
+
+    def __init_subclass__(cls, name: Optional[str] = None, **kwargs):
+        super().__init_subclass__(**kwargs)  # type: ignore
+        if name is None:
+            return
+        if name in RequestorMarketStrategy._registry:
+            raise ValueError(
+                f"Requestor market strategy already registered. name={name}")
+        RequestorMarketStrategy._registry[name] = cls
+
+    @classmethod
+    def get_registered(cls) -> Dict[str, Type['RequestorMarketStrategy']]:
+        """ Named strategies, keyed by name. """
+        return dict(RequestorMarketStrategy._registry)
+
+    @classmethod
+    def get_by_name(cls, name: str) -> Type['RequestorMarketStrategy']:
+        """ Raise KeyError if there is no strategy with the given name. """
+        return RequestorMarketStrategy._registry[name]
+
+    @classmethod
+    def get_name(cls, strategy: Type['RequestorMarketStrategy']) -> str:
+        """ Raise KeyError if the given strategy is not registered. """
+        for name, registered in RequestorMarketStrategy._registry.items():
+            if registered is strategy:
+                return name
+        raise KeyError(strategy)
+
     @classmethod
     @abstractmethod
     def add(cls, task_id: str, offer: Offer):
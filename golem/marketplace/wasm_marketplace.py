@@ -34,7 +34,10 @@ logger = logging.getLogger(__name__)
 USAGE_SECOND = 1e9  # Usage is measured in nanoseconds
 
 
-class RequestorWasmMarketStrategy(RequestorPoolingMarketStrategy):
+class RequestorWasmMarketStrategy(
+        RequestorPoolingMarketStrategy,
+        name='wasm',
+):
     DEFAULT_USAGE_BENCHMARK: float = 1.0 * USAGE_SECOND
 
     _usages: ClassVar[Dict[str, float]] = dict()
@@ -92,27 +95,27 @@ class RequestorWasmMarketStrategy(RequestorPoolingMarketStrategy):
         if task_id not in cls._pools:
             return []
 
-        max_factor: float = cls._max_usage_factor
         offers: List[Offer] = cls._pools.pop(task_id)
-        to_sort: List[Tuple[Offer, float, float]] = []
+        usage_factors = numpy.empty(len(offers))
+        prices = numpy.empty(len(offers))
 
-        for offer in offers:
-            usage_factor = cls.get_usage_factor(
+        for i, offer in enumerate(offers):
+            usage_factors[i] = cls.get_usage_factor(
                 offer.provider_id,
                 offer.provider_performance.usage_benchmark)
-            adjusted_price = usage_factor * offer.price
+            prices[i] = offer.price
             logger.info(
                 "RWMS: offer from %s, b=%.1f, R=%.3f, price=%d Gwei, a=%g",
                 offer.provider_id[:8],
                 offer.provider_performance.usage_benchmark,
-                usage_factor,
+                usage_factors[i],
                 offer.price/10**9,
-                adjusted_price)
-            to_sort.append((offer, usage_factor, adjusted_price))
-        offers_sorted = [t[0] for t in sorted(to_sort, key=lambda t: t[2])
-                         if t[1] <= max_factor]
+                usage_factors[i] * offer.price)
 
-        return offers_sorted
+        adjusted_prices = usage_factors * prices
+        order = numpy.argsort(adjusted_prices, kind='mergesort')
+        accepted = usage_factors[order] <= cls._max_usage_factor
+        return [offers[i] for i in order[accepted]]
 
     @classmethod
     def report_subtask_usages(cls,
@@ -90,6 +90,13 @@ class BaseModel(Model):
     created_date = UTCDateTimeField(default=default_now)
     modified_date = UTCDateTimeField(default=default_now)
 
+    def save(self, force_insert=False, only=None):
+        if force_insert or self._get_pk_value() is None:
+            # New rows start with a single timestamp, both defaults are
+            # evaluated separately
+            self.modified_date = self.created_date
+        return super().save(force_insert=force_insert, only=only)
+
     def refresh(self):
         """
         https://github.com/coleifer/peewee/issues/686#issuecomment-130548126
@@ -556,17 +563,21 @@ class Performance(BaseModel):
 
     @staticmethod
     def update_or_create(env_id: str, performance: float, cpu_usage: int):
-        try:
-            stored = Performance.get(Performance.environment_id == env_id)
-            stored.value = performance
-            stored.cpu_usage = cpu_usage
-            stored.save()
-        except Performance.DoesNotExist:
-            Performance(
-                environment_id=env_id,
+        now = default_now()
+        with db.atomic():
+            updated = Performance.update(
                 value=performance,
-                cpu_usage=cpu_usage
-            ).save()
+                cpu_usage=cpu_usage,
+                modified_date=now,
+            ).where(Performance.environment_id == env_id).execute()
+            if not updated:
+                Performance.insert(
+                    environment_id=env_id,
+                    value=performance,
+                    cpu_usage=cpu_usage,
+                    created_date=now,
+                    modified_date=now,
+                ).execute()
 
 
 class AppBenchmark(BaseModel):
@@ -144,16 +144,43 @@ class TempDirFixture(unittest.TestCase):
             shutil.rmtree(self.tempdir)
 
 
+# Test databases are thrown away after each test, durability is not needed
+TEST_DB_PRAGMAS = (
+    ('journal_mode', 'MEMORY'),
+    ('synchronous', 'OFF'),
+    ('temp_store', 'MEMORY'),
+)
+
+
+# pylint: disable=protected-access
+_DEFAULT_DB_PRAGMAS = db._pragmas
+
+
+def _create_test_database(db_dir) -> Database:
+    """ Create the test database with TEST_DB_PRAGMAS applied on every
+        connection, including the one creating tables. Call
+        _restore_db_pragmas() after closing it. """
+    pragmas = dict(_DEFAULT_DB_PRAGMAS)
+    pragmas.update(TEST_DB_PRAGMAS)
+    db._pragmas = tuple(pragmas.items())
+    return Database(db, fields=DB_FIELDS, models=DB_MODELS, db_dir=db_dir)
+
+
+def _restore_db_pragmas() -> None:
+    db._pragmas = _DEFAULT_DB_PRAGMAS
+# pylint: enable=protected-access
+
+
 class DatabaseFixture(TempDirFixture):
     """ Setups temporary database for tests."""
 
     def setUp(self):
         super(DatabaseFixture, self).setUp()
-        self.database = Database(db, fields=DB_FIELDS, models=DB_MODELS,
-                                 db_dir=self.tempdir)
+        self.database = _create_test_database(self.tempdir)
 
     def tearDown(self):
         self.database.db.close()
+        _restore_db_pragmas()
         super(DatabaseFixture, self).tearDown()
 
 
@@ -202,11 +229,7 @@ def async_test(coro):
 
 @pytest.fixture
 def pytest_database_fixture(tmpdir):
-    database = Database(
-        db,
-        fields=DB_FIELDS,
-        models=DB_MODELS,
-        db_dir=tmpdir
-    )
+    database = _create_test_database(tmpdir)
     yield database
     database.db.close()
+    _restore_db_pragmas()
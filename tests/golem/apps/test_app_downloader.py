@@ -46,6 +46,32 @@ class TestAppDownloader(TempDirFixture):
             new_app_key, apps_path / new_app_key)
         self.assertEqual(download_mock.call_count, 1)
 
+    @patch(f'{ROOT_PATH}.get_bucket_listing')
+    @patch(f'{ROOT_PATH}.download_definition')
+    def test_download_definitions_partial_failure(
+            self, download_mock, bucket_listing_mock):
+        apps_path = self.new_path / 'apps'
+        apps_path.mkdir(exist_ok=True)
+        definition = Mock()
+
+        def _download(key, _destination):
+            if key == 'failing.json':
+                raise requests.exceptions.ConnectionError()
+            return definition
+
+        download_mock.side_effect = _download
+        metadata = [
+            Mock(spec=downloader.Contents, key='ok.json'),
+            Mock(spec=downloader.Contents, key='failing.json'),
+        ]
+        bucket_listing_mock.return_value = Mock(
+            spec=downloader.ListBucketResult, contents=metadata)
+
+        new_definitions = downloader.download_definitions(apps_path)
+
+        self.assertEqual(new_definitions, [definition])
+        self.assertEqual(download_mock.call_count, 2)
+
     @patch('requests.get')
     def test_get_bucket_listing(self, mock_get):
         response = Mock(spec=requests.Response)
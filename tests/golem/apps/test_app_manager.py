@@ -1,11 +1,16 @@
+import json
+import os
+
 from mock import Mock, patch
 
-from golem.apps.manager import AppManager
+from golem.apps.manager import AppManager, AppStates
 from golem.apps import (
     AppDefinition,
+    AppManifest,
     load_app_from_json_file,
     load_apps_from_dir,
 )
+from golem.rpc.mapping.rpceventnames import App
 from golem.testutils import TempDirFixture, DatabaseFixture
 
 ROOT_PATH = 'golem.apps.manager'
@@ -40,7 +45,8 @@ class TestUpdateApps(AppManagerTestBase):
         self.assertEqual(self.app_manager.apps(), [(APP_ID, APP_DEF)])
         self.assertEqual(self.app_manager.app(APP_ID), APP_DEF)
         self.assertFalse(self.app_manager.enabled(APP_ID))
-        self.assertEqual(publisher_mock.publish.call_count, 1)
+        publisher_mock.publish.assert_called_once_with(
+            App.evt_new_definiton, json.loads(APP_DEF.to_json()))
 
         # Definition already exists locally
         download_mock.return_value = []
@@ -48,6 +54,23 @@ class TestUpdateApps(AppManagerTestBase):
         self.assertEqual(self.app_manager.apps(), [(APP_ID, APP_DEF)])
         self.assertEqual(publisher_mock.publish.call_count, 1)
 
+    @patch(f'{ROOT_PATH}.download_definitions')
+    @patch(f'{ROOT_PATH}.EventPublisher')
+    def test_update_duplicate(self, publisher_mock, download_mock):
+        other_app = AppDefinition(
+            name='other_app',
+            requestor_env='test_env',
+            requestor_prereq={},
+            max_benchmark_score=1.0
+        )
+        self.app_manager.register_app(APP_DEF)
+        download_mock.return_value = [other_app, APP_DEF]
+        with self.assertRaises(ValueError):
+            self.app_manager.update_apps()
+        self.assertFalse(self.app_manager.registered(other_app.id))
+        self.assertNotIn(other_app.id, AppStates())
+        publisher_mock.publish.assert_not_called()
+
 
 class TestRegisterApp(AppManagerTestBase):
 
@@ -64,13 +87,17 @@ class TestRegisterApp(AppManagerTestBase):
 
     def test_delete_app(self):
         self.app_manager.register_app(APP_DEF)
-        self.app_manager._app_file_names[APP_ID] = mocked_file = Mock()
+        self.app_manager._entries[APP_ID].path = mocked_file = Mock()
         mocked_file.unlink = Mock()
         self.assertEqual(self.app_manager.apps(), [(APP_ID, APP_DEF)])
         self.app_manager.delete(APP_ID)
         self.assertEqual(self.app_manager.apps(), [])
         mocked_file.unlink.assert_called_once_with()
 
+    def test_delete_not_registered(self):
+        with self.assertRaises(KeyError):
+            self.app_manager.delete(APP_ID)
+
 
 class TestSetEnabled(AppManagerTestBase):
 
@@ -87,6 +114,66 @@ class TestSetEnabled(AppManagerTestBase):
         self.assertFalse(self.app_manager.enabled(APP_ID))
 
 
+class TestAppStates(DatabaseFixture):
+
+    def setUp(self):
+        super().setUp()
+        self.app_states = AppStates()
+
+    def test_get_cached(self):
+        self.app_states[APP_ID] = True
+        with patch.object(AppStates, '_fetch') as fetch_mock:
+            self.assertIn(APP_ID, self.app_states)
+            self.assertTrue(self.app_states[APP_ID])
+            fetch_mock.assert_not_called()
+
+    def test_get_from_db(self):
+        AppStates()[APP_ID] = True
+        self.assertIn(APP_ID, self.app_states)
+        self.assertTrue(self.app_states[APP_ID])
+
+    def test_load(self):
+        self.app_states[APP_ID] = True
+        app_states = AppStates.load()
+        with patch.object(AppStates, '_fetch') as fetch_mock:
+            self.assertTrue(app_states[APP_ID])
+            self.assertNotIn('other_app', app_states)
+            with self.assertRaises(KeyError):
+                _ = app_states['other_app']
+            fetch_mock.assert_not_called()
+
+    def test_missing(self):
+        self.assertNotIn(APP_ID, self.app_states)
+        with self.assertRaises(KeyError):
+            _ = self.app_states[APP_ID]
+
+    def test_set_unchanged(self):
+        self.app_states[APP_ID] = True
+        with patch(f'{ROOT_PATH}.AppConfiguration.insert') as insert_mock:
+            self.app_states[APP_ID] = True
+            self.app_states.bulk_set({APP_ID: True})
+            insert_mock.assert_not_called()
+        self.app_states[APP_ID] = False
+        self.assertFalse(AppStates()[APP_ID])
+
+    def test_bulk_set(self):
+        app_ids = [f'app_{i}' for i in range(500)]
+        self.app_states.bulk_set({app_id: True for app_id in app_ids})
+        app_states = AppStates()
+        for app_id in app_ids:
+            self.assertTrue(app_states[app_id])
+
+    def test_delete(self):
+        self.app_states[APP_ID] = True
+        del self.app_states[APP_ID]
+        self.assertNotIn(APP_ID, self.app_states)
+        self.assertNotIn(APP_ID, AppStates())
+
+    def test_delete_missing(self):
+        with self.assertRaises(KeyError):
+            del self.app_states[APP_ID]
+
+
 class TestLoadAppFromJSONFile(TempDirFixture):
 
     def test_ok(self):
@@ -143,3 +230,51 @@ class TestLoadAppsFromDir(TempDirFixture):
         bogus_file.write_text('(╯°□°）╯︵ ┻━┻', encoding='utf-8')
         loaded_apps = list(load_apps_from_dir(self.new_path))
         self.assertEqual(loaded_apps, [(app_file, APP_DEF)])
+
+    def test_manifest(self):
+        app_file = self.new_path / 'test_app.json'
+        app_file.write_text(APP_DEF.to_json(), encoding='utf-8')
+        manifest = AppManifest(self.new_path)
+        loaded_apps = list(load_apps_from_dir(self.new_path, manifest))
+        self.assertEqual(loaded_apps, [(app_file, APP_DEF)])
+        manifest.save()
+
+        with patch('golem.apps.load_app_from_json_file') as load_mock:
+            manifest = AppManifest(self.new_path)
+            loaded_apps = list(load_apps_from_dir(self.new_path, manifest))
+            self.assertEqual(loaded_apps, [(app_file, APP_DEF)])
+            load_mock.assert_not_called()
+
+    def test_manifest_invalid(self):
+        app_file = self.new_path / 'test_app.json'
+        app_file.write_text(APP_DEF.to_json(), encoding='utf-8')
+        manifest_file = self.new_path / '.manifest.json'
+        for content in ('[]', '{"test_app.json": 1}'):
+            manifest_file.write_text(content, encoding='utf-8')
+            manifest = AppManifest(self.new_path)
+            loaded_apps = list(load_apps_from_dir(self.new_path, manifest))
+            self.assertEqual(loaded_apps, [(app_file, APP_DEF)])
+
+    def test_manifest_files_skipped(self):
+        (self.new_path / '.manifest.json').write_text('{}', encoding='utf-8')
+        (self.new_path / '.manifest.json.tmp').write_text(
+            APP_DEF.to_json(), encoding='utf-8')
+        with patch('golem.apps.load_app_from_json_file') as load_mock:
+            loaded_apps = list(load_apps_from_dir(self.new_path))
+            self.assertEqual(loaded_apps, [])
+            load_mock.assert_not_called()
+
+    def test_manifest_file_modified(self):
+        app_file = self.new_path / 'test_app.json'
+        app_file.write_text(APP_DEF.to_json(), encoding='utf-8')
+        manifest = AppManifest(self.new_path)
+        list(load_apps_from_dir(self.new_path, manifest))
+        manifest.save()
+
+        stat = app_file.stat()
+        os.utime(str(app_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        with patch('golem.apps.load_app_from_json_file') as load_mock:
+            load_mock.return_value = APP_DEF
+            manifest = AppManifest(self.new_path)
+            list(load_apps_from_dir(self.new_path, manifest))
+            load_mock.assert_called_once_with(app_file)
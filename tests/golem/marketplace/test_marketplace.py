@@ -1,3 +1,5 @@
+import copy
+import pickle
 import sys
 from unittest import TestCase
 from unittest.mock import patch, Mock, MagicMock
@@ -10,6 +12,7 @@ from golem_messages.datastructures.stats import ProviderStats
 from golem import testutils
 
 from golem.marketplace import (
+    RequestorMarketStrategy,
     RequestorBrassMarketStrategy,
     RequestorWasmMarketStrategy,
     ProviderBrassMarketStrategy,
@@ -36,6 +39,35 @@ class TestScalePrice(TestCase):
         assert scale_price(5, 0) == sys.float_info.max
 
 
+class TestProviderPerformance(TestCase):
+
+    def test_copy_and_pickle(self):
+        performance = ProviderPerformance(1.5)
+        assert copy.copy(performance) == performance
+        assert copy.deepcopy(performance) == performance
+        assert pickle.loads(pickle.dumps(performance)) == performance
+
+
+class TestRequestorMarketStrategyRegistry(TestCase):
+
+    def test_registered(self):
+        registered = RequestorMarketStrategy.get_registered()
+        assert registered['brass'] is RequestorBrassMarketStrategy
+        assert registered['wasm'] is RequestorWasmMarketStrategy
+        assert RequestorMarketStrategy.get_by_name('wasm') \
+            is RequestorWasmMarketStrategy
+        assert RequestorMarketStrategy.get_name(
+            RequestorBrassMarketStrategy) == 'brass'
+
+    def test_duplicate_name(self):
+        with self.assertRaises(ValueError):
+            # pylint: disable=unused-variable
+            class _Strategy(RequestorBrassMarketStrategy, name='brass'):
+                pass
+        assert RequestorMarketStrategy.get_by_name('brass') \
+            is RequestorBrassMarketStrategy
+
+
 @patch('golem.ranking.manager.database_manager.get_provider_efficiency',
        Mock(return_value=0.0))
 @patch('golem.ranking.manager.database_manager.get_provider_efficacy',
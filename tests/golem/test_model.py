@@ -21,6 +21,13 @@ class TestBaseModel(DatabaseFixture):
         self.assertIs(instance.created_date.tzinfo, timezone.utc)
         self.assertIs(instance_copy.created_date.tzinfo, timezone.utc)
 
+    def test_default_dates_equal(self):
+        instance = m.GenericKeyValue.create(key='test')
+        self.assertEqual(instance.created_date, instance.modified_date)
+        instance_copy = m.GenericKeyValue.get()
+        self.assertEqual(
+            instance_copy.created_date, instance_copy.modified_date)
+
 
 class TestPayment(DatabaseFixture):
     def test_payment_big_value(self):
@@ -146,6 +153,7 @@ class TestPerformance(DatabaseFixture):
         stored = m.Performance.get(m.Performance.environment_id == env_id)
         self.assertEqual(stored.value, 100.0)
         self.assertEqual(stored.cpu_usage, 1000)
+        self.assertEqual(stored.created_date, stored.modified_date)
 
         m.Performance.update_or_create(
             env_id=env_id,